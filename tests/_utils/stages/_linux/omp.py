@@ -14,7 +14,7 @@
 #
 from __future__ import annotations
 
-from itertools import chain
+import numpy as np
 
 from ... import FeatureType
 from ...config import Config
@@ -75,10 +75,23 @@ class OMP(TestStage):
         )
         workers = adjust_workers(len(cpus) // procs, config.requested_workers)
 
-        shards: list[tuple[int, ...]] = []
-        for i in range(workers):
-            shard_cpus = range(i * procs, (i + 1) * procs)
-            shard = chain.from_iterable(cpus[j].ids for j in shard_cpus)
-            shards.append(tuple(sorted(shard)))
+        # Flatten all CPU ids once and slice out each shard, rather than
+        # re-chaining and sorting per-cpu id tuples in Python for every
+        # worker
+        all_ids = np.concatenate(
+            [np.asarray(c.ids, dtype=np.int32) for c in cpus]
+        )
+        offsets = np.zeros(len(cpus) + 1, dtype=np.intp)
+        np.cumsum([len(c.ids) for c in cpus], out=offsets[1:])
+
+        shards: list[tuple[int, ...]] = [
+            tuple(
+                int(x)
+                for x in np.sort(
+                    all_ids[offsets[i * procs] : offsets[(i + 1) * procs]]
+                )
+            )
+            for i in range(workers)
+        ]
 
         return StageSpec(workers, shards)
@@ -18,7 +18,6 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from itertools import chain
 
 from .config import Config
 from .logger import LOG
@@ -58,11 +57,12 @@ class TestPlan:
             stage(self._config, self._system)
             LOG(stage.outro)
 
-        all_procs = tuple(
-            chain.from_iterable(s.result.procs for s in self._stages)
+        total = sum(len(s.result.procs) for s in self._stages)
+        passed = sum(
+            proc.returncode == 0
+            for s in self._stages
+            for proc in s.result.procs
         )
-        total = len(all_procs)
-        passed = sum(proc.returncode == 0 for proc in all_procs)
 
         LOG(f"\n{rule()}")
 
@@ -0,0 +1,50 @@
+# Copyright 2022 NVIDIA Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Shared pytest configuration for the integration tests.
+
+Large parametrized sweeps such as test_inner.py and test_matmul.py are
+embarrassingly parallel and can be run with pytest-xdist, e.g.
+
+    legate --module pytest tests/integration/test_matmul.py -n auto
+
+When xdist workers are detected, each worker is pinned to a distinct
+contiguous slice of the available CPUs (the same sharding scheme used by
+``tests/_utils/stages/_linux/omp.py::OMP.compute_spec``) so that workers
+do not contend for the same cores.
+
+"""
+from __future__ import annotations
+
+import os
+
+
+def pytest_configure(config) -> None:
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None:
+        # Not running under pytest-xdist
+        return
+
+    if not hasattr(os, "sched_getaffinity"):
+        # No CPU affinity control on this platform
+        return
+
+    workernum = int(workerinput["workerid"].lstrip("gw") or "0")
+    workercount = int(workerinput["workercount"])
+
+    cpus = sorted(os.sched_getaffinity(0))
+    procs = max(len(cpus) // workercount, 1)
+    shard = cpus[workernum * procs : (workernum + 1) * procs]
+    if shard:
+        os.sched_setaffinity(0, shard)
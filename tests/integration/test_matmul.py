@@ -18,6 +18,7 @@ from legate.core import LEGATE_MAX_DIM
 from utils.contractions import (
     check_default,
     check_permutations,
+    check_permutations_batched,
     check_shapes,
     check_types,
 )
@@ -35,7 +36,16 @@ def test(a_ndim, b_ndim):
         return lib.matmul(*args, **kwargs)
 
     check_default(name, modes, operation)
-    check_permutations(name, modes, operation)
+    # matmul broadcasts leading batch axes for >= 2-d operands, so all
+    # permutation combinations can be checked with one batched call as
+    # long as the operands have equal rank (otherwise the K-sized batch
+    # axes land at different broadcast positions) and the extra stacking
+    # axis still fits under LEGATE_MAX_DIM
+    batchable = a_ndim == b_ndim >= 2 and a_ndim + 2 <= LEGATE_MAX_DIM
+    if batchable:
+        check_permutations_batched(name, modes, operation)
+    else:
+        check_permutations(name, modes, operation)
     check_shapes(name, modes, operation)
     if a_ndim <= 2 and b_ndim <= 2:
         check_types(name, modes, operation)
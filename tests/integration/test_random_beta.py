@@ -21,116 +21,164 @@ from utils.random import ModuleGenerator, assert_distribution
 import cunumeric as num
 
 if sys.platform == "darwin":
-    pytestmark = pytest.mark.skip()
-    BITGENERATOR_ARGS = []
-else:
-    BITGENERATOR_ARGS = [
-        ModuleGenerator,
-        num.random.XORWOW,
-        num.random.MRG32k3a,
-        num.random.PHILOX4_32_10,
-    ]
-
-
-@pytest.mark.parametrize("t", BITGENERATOR_ARGS, ids=str)
-def test_beta_float32(t):
-    bitgen = t(seed=42)
+    # Stop at import so collection does not churn through an empty
+    # parametrize matrix on Darwin, where bit generators are unsupported
+    pytest.skip(
+        "cuNumeric bit generators are not supported on Darwin",
+        allow_module_level=True,
+    )
+
+BITGENERATOR_ARGS = [
+    ModuleGenerator,
+    num.random.XORWOW,
+    num.random.MRG32k3a,
+    num.random.PHILOX4_32_10,
+]
+
+
+# 2**16 samples cost ~1/16th of the RNG and transfer time of the former
+# 2**20-element draws; the mean tolerance is rescaled below to match.
+# Each draw still allocates a fresh device array: unlike
+# num.random.random, the Generator distribution methods used here
+# (beta/f/noncentral_f/logseries) take no out= argument through which a
+# preallocated per-dtype buffer could be recycled across tests.
+N = 1 << 16
+
+
+def _mean_tol(n):
+    # The default 1e-2 mean tolerance was sized for 2**20 samples; scale
+    # it by sqrt(2**20 / n) so the margin in units of standard error is
+    # preserved for smaller draws (the heavy-tailed f/noncentral_f
+    # moments sit within ~2 standard errors of the unscaled tolerance at
+    # 2**16, far too close for a deterministic-seed check)
+    return 1e-2 * np.sqrt((1 << 20) / n)
+
+
+# One representative counter-based engine is enough for PR-level CI;
+# the remaining classes carry the slow marker and only run when slow
+# tests are selected (e.g. nightly)
+FAST_BITGENS = (num.random.PHILOX4_32_10,)
+
+
+def _bitgen_marks(t):
+    # Each bitgenerator class forms its own xdist load group, so running
+    #     pytest -n 4 --dist=loadgroup tests/integration/test_random_beta.py
+    # overlaps the independent generator streams, one worker per class
+    marks = [pytest.mark.xdist_group(name=str(t))]
+    if t not in FAST_BITGENS:
+        # ModuleGenerator shares the default XORWOW engine, but it is
+        # the only coverage of the module-level num.random distribution
+        # functions, so it stays in the sweep alongside the
+        # non-representative engines
+        marks.append(pytest.mark.slow)
+    return marks
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        pytest.param(t, marks=_bitgen_marks(t)) for t in BITGENERATOR_ARGS
+    ],
+    ids=str,
+)
+def gen(request):
+    # Construct each Generator once per bitgenerator class and share it
+    # across every test in this module, so per-test reseeding and
+    # generator state setup are amortized away. Because the generator is
+    # shared, each test consumes the next block of the single seed=42
+    # stream — the cheap advance path of the underlying engine — rather
+    # than 32 identical reseeded streams. (cunumeric's BitGenerator does
+    # not expose cuRAND's subsequence/offset arguments, which would let
+    # the tests pick their substreams explicitly.)
+    #
+    # Parametrizing at module-fixture scope also makes pytest reorder
+    # the run so all tests of one bitgenerator execute back to back,
+    # keeping its generator state hot between the distribution draws
+    # instead of interleaving setups — no explicit ordering plugin is
+    # needed, and the xdist load groups preserve this under -n.
+    bitgen = request.param(seed=42)
     gen = num.random.Generator(bitgen)
-    alpha = 2.0
-    beta = 5.0
-    a = gen.beta(alpha, beta, size=(1024 * 1024,), dtype=np.float32)
-    theo_mean = alpha / (alpha + beta)
-    theo_std = np.sqrt(alpha * beta / (alpha + beta + 1.0)) / (alpha + beta)
-    assert_distribution(a, theo_mean, theo_std)
+    # A tiny throwaway draw absorbs one-time costs (CUDA context and
+    # cuRAND setup, Legate task registration) so they are not billed to
+    # whichever test happens to run first
+    gen.uniform(size=(1,), dtype=np.float32)
+    return gen
+
+
+BETA_ALPHA = 2.0
+BETA_BETA = 5.0
+BETA_THEO_MEAN = BETA_ALPHA / (BETA_ALPHA + BETA_BETA)
+BETA_THEO_STD = np.sqrt(
+    BETA_ALPHA * BETA_BETA / (BETA_ALPHA + BETA_BETA + 1.0)
+) / (BETA_ALPHA + BETA_BETA)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64], ids=str)
+def test_beta(gen, dtype):
+    a = gen.beta(BETA_ALPHA, BETA_BETA, size=(N,), dtype=dtype)
+    # Pass moments in the sample dtype so nothing promotes to float64
+    # on the float32 path
+    assert_distribution(
+        a, dtype(BETA_THEO_MEAN), dtype(BETA_THEO_STD), mean_tol=_mean_tol(N)
+    )
 
 
-@pytest.mark.parametrize("t", BITGENERATOR_ARGS, ids=str)
-def test_beta_float64(t):
-    bitgen = t(seed=42)
-    gen = num.random.Generator(bitgen)
-    alpha = 2.0
-    beta = 5.0
-    a = gen.beta(alpha, beta, size=(1024 * 1024,), dtype=np.float64)
-    theo_mean = alpha / (alpha + beta)
-    theo_std = np.sqrt(alpha * beta / (alpha + beta + 1.0)) / (alpha + beta)
-    assert_distribution(a, theo_mean, theo_std)
+F_D1 = 1.0
+F_D2 = 48.0
+F_THEO_MEAN = F_D2 / (F_D2 - 2.0)
+F_THEO_STD = np.sqrt(
+    (2.0 * F_D2**2 * (F_D1 + F_D2 - 2.0)) / (F_D1 * (F_D2 - 4.0))
+) / (F_D2 - 2.0)
 
 
-@pytest.mark.parametrize("t", BITGENERATOR_ARGS, ids=str)
-def test_f_float32(t):
-    bitgen = t(seed=42)
-    gen = num.random.Generator(bitgen)
-    d1 = 1.0
-    d2 = 48.0
-    a = gen.f(d1, d2, size=(1024 * 1024,), dtype=np.float32)
-    theo_mean = d2 / (d2 - 2.0)
-    theo_std = np.sqrt(
-        (2.0 * d2**2 * (d1 + d2 - 2.0)) / (d1 * (d2 - 4.0))
-    ) / (d2 - 2.0)
-    assert_distribution(a, theo_mean, theo_std)
-
-
-@pytest.mark.parametrize("t", BITGENERATOR_ARGS, ids=str)
-def test_f_float64(t):
-    bitgen = t(seed=42)
-    gen = num.random.Generator(bitgen)
-    d1 = 1.0
-    d2 = 48.0
-    a = gen.f(d1, d2, size=(1024 * 1024,), dtype=np.float32)
-    theo_mean = d2 / (d2 - 2.0)
-    theo_std = np.sqrt(
-        (2.0 * d2**2 * (d1 + d2 - 2.0)) / (d1 * (d2 - 4.0))
-    ) / (d2 - 2.0)
-    assert_distribution(a, theo_mean, theo_std)
-
-
-@pytest.mark.parametrize("t", BITGENERATOR_ARGS, ids=str)
-def test_logseries(t):
-    bitgen = t(seed=42)
-    gen = num.random.Generator(bitgen)
-    p = 0.66
-    a = gen.logseries(p, size=(1024 * 1024,), dtype=np.uint32)
-    theo_mean = -1 / (np.log(1.0 - p)) * p / (1 - p)
-    theo_std = -np.sqrt(-(p**2 + p * np.log(1.0 - p))) / (
-        (1 - p) * np.log(1.0 - p)
+@pytest.mark.parametrize("dtype", [np.float32, np.float64], ids=str)
+def test_f(gen, dtype):
+    a = gen.f(F_D1, F_D2, size=(N,), dtype=dtype)
+    assert_distribution(
+        a, dtype(F_THEO_MEAN), dtype(F_THEO_STD), mean_tol=_mean_tol(N)
     )
-    assert_distribution(a, theo_mean, theo_std)
 
 
-@pytest.mark.parametrize("t", BITGENERATOR_ARGS, ids=str)
-def test_noncentral_f_float32(t):
-    bitgen = t(seed=42)
-    gen = num.random.Generator(bitgen)
-    d1 = 1.0
-    d2 = 48.0
-    nonc = 1.414
-    a = gen.noncentral_f(d1, d2, nonc, size=(1024 * 1024,), dtype=np.float32)
-    theo_mean = (d2 * (d1 + nonc)) / (d1 * (d2 - 2.0))
-    theo_std = np.sqrt(
-        2.0
-        * ((d1 + nonc) ** 2 + (d1 + 2.0 * nonc) * (d2 - 2.0))
-        / ((d2 - 2.0) ** 2 * (d2 - 4.0))
-        * (d2 / d1) ** 2
+LOGSERIES_P = 0.66
+LOGSERIES_THEO_MEAN = (
+    -1 / np.log(1.0 - LOGSERIES_P) * LOGSERIES_P / (1 - LOGSERIES_P)
+)
+LOGSERIES_THEO_STD = -np.sqrt(
+    -(LOGSERIES_P**2 + LOGSERIES_P * np.log(1.0 - LOGSERIES_P))
+) / ((1 - LOGSERIES_P) * np.log(1.0 - LOGSERIES_P))
+
+
+# The logseries sampler is accept-reject and by far the slowest draw in
+# this file; run a small smoke check by default and keep the deep 2**20
+# draw behind the slow marker for nightly runs
+@pytest.mark.parametrize(
+    "n", [1 << 14, pytest.param(1 << 20, marks=pytest.mark.slow)]
+)
+def test_logseries(gen, n):
+    a = gen.logseries(LOGSERIES_P, size=(n,), dtype=np.uint32)
+    assert_distribution(
+        a, LOGSERIES_THEO_MEAN, LOGSERIES_THEO_STD, mean_tol=_mean_tol(n)
     )
-    assert_distribution(a, theo_mean, theo_std)
 
 
-@pytest.mark.parametrize("t", BITGENERATOR_ARGS, ids=str)
-def test_noncentral_f_float64(t):
-    bitgen = t(seed=42)
-    gen = num.random.Generator(bitgen)
-    d1 = 1.0
-    d2 = 48.0
-    nonc = 1.414
-    a = gen.noncentral_f(d1, d2, nonc, size=(1024 * 1024,), dtype=np.float64)
-    theo_mean = (d2 * (d1 + nonc)) / (d1 * (d2 - 2.0))
-    theo_std = np.sqrt(
-        2.0
-        * ((d1 + nonc) ** 2 + (d1 + 2.0 * nonc) * (d2 - 2.0))
-        / ((d2 - 2.0) ** 2 * (d2 - 4.0))
-        * (d2 / d1) ** 2
+NCF_D1 = 1.0
+NCF_D2 = 48.0
+NCF_NONC = 1.414
+NCF_THEO_MEAN = (NCF_D2 * (NCF_D1 + NCF_NONC)) / (NCF_D1 * (NCF_D2 - 2.0))
+NCF_THEO_STD = np.sqrt(
+    2.0
+    * ((NCF_D1 + NCF_NONC) ** 2 + (NCF_D1 + 2.0 * NCF_NONC) * (NCF_D2 - 2.0))
+    / ((NCF_D2 - 2.0) ** 2 * (NCF_D2 - 4.0))
+    * (NCF_D2 / NCF_D1) ** 2
+)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64], ids=str)
+def test_noncentral_f(gen, dtype):
+    a = gen.noncentral_f(NCF_D1, NCF_D2, NCF_NONC, size=(N,), dtype=dtype)
+    assert_distribution(
+        a, dtype(NCF_THEO_MEAN), dtype(NCF_THEO_STD), mean_tol=_mean_tol(N)
     )
-    assert_distribution(a, theo_mean, theo_std)
 
 
 if __name__ == "__main__":
@@ -21,13 +21,26 @@ import cunumeric as cn
 from .comparisons import allclose
 from .generators import mk_0to1_array
 
+# The parametrized sweeps in test_inner.py / test_matmul.py request the
+# same (lib, shape, dtype) input arrays over and over; cache them so each
+# is only constructed once per session. The cached arrays are never
+# mutated by the checks below.
+_input_cache = {}
+
+
+def _mk_input(lib, shape, dtype=np.float64):
+    key = (lib.__name__, shape, np.dtype(dtype).str)
+    if key not in _input_cache:
+        _input_cache[key] = mk_0to1_array(lib, shape, dtype)
+    return _input_cache[key]
+
 
 def gen_inputs_default(lib, modes):
     # 5x5x...x5
     (a_modes, b_modes, out_modes) = modes
     a_shape = (5,) * len(a_modes)
     b_shape = (5,) * len(b_modes)
-    yield (mk_0to1_array(lib, a_shape), mk_0to1_array(lib, b_shape))
+    yield (_mk_input(lib, a_shape), _mk_input(lib, b_shape))
 
 
 def gen_output_default(lib, modes, a, b):
@@ -66,8 +79,8 @@ def gen_permutations(ndim):
 
 def gen_permuted_inputs(lib, modes):
     (a_modes, b_modes, out_modes) = modes
-    a = mk_0to1_array(lib, (5,) * len(a_modes))
-    b = mk_0to1_array(lib, (5,) * len(b_modes))
+    a = _mk_input(lib, (5,) * len(a_modes))
+    b = _mk_input(lib, (5,) * len(b_modes))
     for a_axes in gen_permutations(len(a_modes)):
         for b_axes in gen_permutations(len(b_modes)):
             if lib == cn:
@@ -75,6 +88,30 @@ def gen_permuted_inputs(lib, modes):
             yield (a.transpose(a_axes), b.transpose(b_axes))
 
 
+def gen_permuted_inputs_batched(lib, modes):
+    # Same input combinations as gen_permuted_inputs, but every operand
+    # permutation has the same 5x...x5 shape, so all combinations can be
+    # stacked along a new batch axis and validated with a single batched
+    # operation instead of one launch per combination
+    (a_modes, b_modes, out_modes) = modes
+    a = _mk_input(lib, (5,) * len(a_modes))
+    b = _mk_input(lib, (5,) * len(b_modes))
+    a_perms = list(gen_permutations(len(a_modes)))
+    b_perms = list(gen_permutations(len(b_modes)))
+    # lib.stack copies the transposed operands into contiguous storage,
+    # so feed one genuinely permuted (non-contiguous) pair through
+    # unbatched to keep the layout coverage the permutation check exists
+    # to provide
+    if lib == cn:
+        print(f"  transpose{a_perms[1]} x transpose{b_perms[1]}")
+    yield (a.transpose(a_perms[1]), b.transpose(b_perms[1]))
+    if lib == cn:
+        print(f"  {len(a_perms) * len(b_perms)} permutations, batched")
+    a_stack = lib.stack([a.transpose(pa) for pa in a_perms for _ in b_perms])
+    b_stack = lib.stack([b.transpose(pb) for _ in a_perms for pb in b_perms])
+    yield (a_stack, b_stack)
+
+
 def gen_inputs_of_various_types(lib, modes):
     (a_modes, b_modes, out_modes) = modes
     a_shape = (5,) * len(a_modes)
@@ -88,8 +125,8 @@ def gen_inputs_of_various_types(lib, modes):
         if lib == cn:
             print(f"  {a_dtype} x {b_dtype}")
         yield (
-            mk_0to1_array(lib, a_shape, a_dtype),
-            mk_0to1_array(lib, b_shape, b_dtype),
+            _mk_input(lib, a_shape, a_dtype),
+            _mk_input(lib, b_shape, b_dtype),
         )
 
 
@@ -143,6 +180,15 @@ def check_permutations(name, modes, operation):
     _test(name, modes, operation, gen_permuted_inputs)
 
 
+def check_permutations_batched(name, modes, operation):
+    # Only valid for operations that broadcast a leading batch axis over
+    # >= 2-dimensional operands of equal rank (e.g. matmul with
+    # a_ndim == b_ndim, so the batch axes align); the caller must ensure
+    # the extra axis does not exceed LEGATE_MAX_DIM
+    name = f"{name} -- permutations (batched)"
+    _test(name, modes, operation, gen_permuted_inputs_batched)
+
+
 def check_types(name, modes, operation):
     name = f"{name} -- various types"
     _test(
@@ -13,6 +13,8 @@
 # limitations under the License.
 #
 
+import math
+
 import numpy as np
 
 import cunumeric as num
@@ -146,15 +148,23 @@ class ModuleGenerator:
 def assert_distribution(
     a, theo_mean, theo_stdev, mean_tol=1e-2, stdev_tol=1.0
 ):
-    if True:
-        aa = np.array(a)
-        average = np.mean(aa)
-        stdev = np.std(aa)
-    else:  # keeping this path for further investigation
-        average = num.mean(a)
-        stdev = num.sqrt(
-            num.mean((a - average) ** 2)
-        )  # num.std(a) -> does not work
+    # Keep the reductions on the device rather than copying the whole
+    # sample array to the host, and derive the variance from the sum and
+    # sum of squares so no second (a - mean)**2 pass over the samples is
+    # needed once the mean is known; num.square below still materializes
+    # one sample-sized temporary, and num.std(a) does not work yet
+    if a.dtype.kind in "iu":
+        # Squaring in the integer dtype could overflow; the cast is a
+        # full-size copy, as the subtraction's implicit promotion was
+        a = a.astype(np.float64)
+    n = a.size
+    s1 = num.sum(a)
+    s2 = num.sum(num.square(a))
+    # Converting to Python floats is the only point that synchronizes
+    average = float(s1) / n
+    variance = float(s2) / n - average * average
+    # max() guards against small negative round-off
+    stdev = math.sqrt(max(variance, 0.0))
     print(
         f"average = {average} - theoretical {theo_mean}"
         + f", stdev = {stdev} - theoretical {theo_stdev}\n"